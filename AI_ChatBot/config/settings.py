@@ -18,6 +18,7 @@ class Settings:
     PROJECT_ROOT = Path(__file__).parent.parent
     PDF_PATH: str = os.getenv('PDF_PATH', str(PROJECT_ROOT / 'data' / 'Mplan.pdf'))
     VECTOR_STORE_PATH: str = str(PROJECT_ROOT / 'data' / 'vector_store')
+    LEXICAL_INDEX_PATH: str = str(PROJECT_ROOT / 'data' / 'lexical_index.json')
     
     # === 模型配置 ===
     EMBEDDING_MODEL: str = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
@@ -30,6 +31,15 @@ class Settings:
     RETRIEVAL_TOP_K: int = int(os.getenv('RETRIEVAL_TOP_K', '3'))
     TYPING_SPEED_MS: int = int(os.getenv('TYPING_SPEED_MS', '30'))
     
+    # === 混合檢索配置 ===
+    HYBRID_SEARCH_ENABLED: bool = os.getenv('HYBRID_SEARCH_ENABLED', 'true').lower() == 'true'
+    HYBRID_CANDIDATE_K: int = int(os.getenv('HYBRID_CANDIDATE_K', '20'))
+    RRF_K: int = int(os.getenv('RRF_K', '60'))
+    BM25_K1: float = float(os.getenv('BM25_K1', '1.5'))
+    BM25_B: float = float(os.getenv('BM25_B', '0.75'))
+    LEXICAL_FAST_PATH_ENABLED: bool = os.getenv('LEXICAL_FAST_PATH_ENABLED', 'false').lower() == 'true'
+    LEXICAL_FAST_PATH_MARGIN: float = float(os.getenv('LEXICAL_FAST_PATH_MARGIN', '1.5'))
+    
     # === FAQ 問題 ===
     FAQ_QUESTIONS: List[str] = [
         "這個產品適合糖尿病患者使用嗎？",
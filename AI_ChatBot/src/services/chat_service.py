@@ -46,7 +46,7 @@ class ChatService:
             self.last_interaction_time = datetime.now()
             
             # 檢索相關文檔
-            retrieved_docs_with_score = vector_service.similarity_search_with_score(
+            retrieved_docs_with_score = vector_service.search_with_score(
                 user_message, k=settings.RETRIEVAL_TOP_K
             )
             
@@ -76,6 +76,7 @@ class ChatService:
                 {
                     "source": doc.metadata.get("source", ""),
                     "score": float(score),
+                    "score_type": vector_service.score_type,
                     "preview": doc.page_content[:200]
                 }
                 for doc, score in retrieved_docs_with_score
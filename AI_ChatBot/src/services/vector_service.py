@@ -7,6 +7,7 @@ from langchain_core.documents import Document
 from langchain_community.document_loaders import PyPDFLoader
 
 from config.settings import settings
+from src.utils.lexical_index import LexicalIndex, fingerprint, reciprocal_rank_fusion
 from src.utils.logger import setup_logger
 from src.utils.exceptions import VectorStoreException, DocumentLoadException
 
@@ -18,6 +19,7 @@ class VectorService:
     def __init__(self):
         self.embedding_model = None
         self.vector_store = None
+        self.lexical_index = None
         self._initialize()
     
     def _initialize(self) -> None:
@@ -37,6 +39,10 @@ class VectorService:
             else:
                 logger.info("🔄 建立新的向量資料庫...")
                 self._build_vector_store()
+            
+            # 載入或建立倒排索引
+            if self.lexical_index is None and not self._load_existing_lexical_index():
+                self._build_lexical_index_from_vector_store()
                 
         except Exception as e:
             logger.error(f"❌ 向量服務初始化失敗: {e}")
@@ -57,6 +63,35 @@ class VectorService:
             logger.warning(f"⚠️ 載入現有向量資料庫失敗: {e}")
         return False
     
+    def _load_existing_lexical_index(self) -> bool:
+        """嘗試載入現有的倒排索引"""
+        try:
+            lexical_index_path = Path(settings.LEXICAL_INDEX_PATH)
+            if lexical_index_path.exists():
+                lexical_index = LexicalIndex.load(str(lexical_index_path))
+                if lexical_index.fingerprint != fingerprint(self._get_vector_store_documents()):
+                    logger.warning("⚠️ 倒排索引與向量資料庫不一致，將重新建立")
+                    return False
+                self.lexical_index = lexical_index
+                logger.info("✅ 成功載入現有倒排索引")
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ 載入現有倒排索引失敗: {e}")
+        return False
+    
+    def _get_vector_store_documents(self) -> List[Document]:
+        """依索引順序取出向量資料庫中的文檔"""
+        docstore = self.vector_store.docstore
+        index_to_docstore_id = self.vector_store.index_to_docstore_id
+        docs = [docstore.search(index_to_docstore_id[i]) for i in sorted(index_to_docstore_id)]
+        return [doc for doc in docs if isinstance(doc, Document)]
+    
+    def _build_lexical_index_from_vector_store(self) -> None:
+        """由向量資料庫中的文檔重建倒排索引（無需重新解析 PDF）"""
+        self.lexical_index = LexicalIndex.from_documents(self._get_vector_store_documents())
+        self._save_lexical_index()
+        logger.info(f"✅ 成功建立倒排索引，共 {len(self.lexical_index.documents)} 個文檔")
+    
     def _build_vector_store(self) -> None:
         """建立新的向量資料庫"""
         try:
@@ -66,8 +101,12 @@ class VectorService:
             # 建立向量資料庫
             self.vector_store = FAISS.from_documents(docs, self.embedding_model)
             
-            # 保存向量資料庫
+            # 同步建立倒排索引
+            self.lexical_index = LexicalIndex.from_documents(docs)
+            
+            # 保存向量資料庫與倒排索引
             self._save_vector_store()
+            self._save_lexical_index()
             
             logger.info(f"✅ 成功建立向量資料庫，共 {len(docs)} 個文檔")
             
@@ -112,6 +151,14 @@ class VectorService:
         except Exception as e:
             logger.warning(f"⚠️ 保存向量資料庫失敗: {e}")
     
+    def _save_lexical_index(self) -> None:
+        """保存倒排索引到本地"""
+        try:
+            self.lexical_index.save(settings.LEXICAL_INDEX_PATH)
+            logger.info(f"💾 倒排索引已保存至: {settings.LEXICAL_INDEX_PATH}")
+        except Exception as e:
+            logger.warning(f"⚠️ 保存倒排索引失敗: {e}")
+    
     def similarity_search_with_score(self, query: str, k: int = None) -> List[Tuple[Document, float]]:
         """執行相似度搜尋"""
         if not self.vector_store:
@@ -126,6 +173,53 @@ class VectorService:
         except Exception as e:
             logger.error(f"❌ 向量檢索失敗: {e}")
             raise VectorStoreException(f"Vector search failed: {e}")
+    
+    def hybrid_search_with_score(self, query: str, k: int = None) -> List[Tuple[Document, float]]:
+        """執行混合檢索（BM25 + 向量），以 Reciprocal Rank Fusion 融合排序，分數越高越相關"""
+        if not self.vector_store:
+            raise VectorStoreException("向量資料庫未初始化")
+        if not self.lexical_index:
+            raise VectorStoreException("倒排索引未初始化")
+        
+        k = k or settings.RETRIEVAL_TOP_K
+        candidate_k = max(k, settings.HYBRID_CANDIDATE_K)
+        
+        try:
+            lexical_results, confident = self.lexical_index.search_with_confidence(query, candidate_k)
+            
+            # 快速路徑：高信心精確詞查詢直接使用倒排索引，跳過 embedding
+            if settings.LEXICAL_FAST_PATH_ENABLED and confident:
+                results = reciprocal_rank_fusion([lexical_results], k)
+                logger.info(f"⚡ 詞彙快速路徑: '{query}' -> {len(results)} 個結果")
+                return results
+            
+            vector_results = self.vector_store.similarity_search_with_score(query, k=candidate_k)
+            
+            results = reciprocal_rank_fusion([lexical_results, vector_results], k)
+            logger.info(
+                f"🔍 混合檢索: '{query}' -> 詞彙 {len(lexical_results)} / 向量 {len(vector_results)}"
+                f" -> {len(results)} 個結果"
+            )
+            return results
+        except Exception as e:
+            logger.error(f"❌ 混合檢索失敗: {e}")
+            raise VectorStoreException(f"Hybrid search failed: {e}")
+    
+    @property
+    def score_type(self) -> str:
+        """目前檢索模式的分數類型：rrf（越高越相關）或 l2_distance（越低越相關）"""
+        return "rrf" if settings.HYBRID_SEARCH_ENABLED else "l2_distance"
+    
+    def search_with_score(self, query: str, k: int = None) -> List[Tuple[Document, float]]:
+        """依設定執行混合檢索或純向量檢索
+        
+        混合檢索（含快速路徑）回傳 RRF 排名分數，越高越相關；
+        純向量檢索回傳 FAISS L2 距離，越低越相關，兩者不可互相比較；
+        分數類型可由 score_type 取得。
+        """
+        if settings.HYBRID_SEARCH_ENABLED:
+            return self.hybrid_search_with_score(query, k)
+        return self.similarity_search_with_score(query, k)
 
 # 全域向量服務實例
 vector_service = VectorService()
\ No newline at end of file
@@ -1,6 +1,6 @@
 """
 工具模組
-包含日誌、異常處理等輔助功能
+包含日誌、異常處理、倒排索引等輔助功能
 """
 
 from .logger import setup_logger, logger
@@ -10,6 +10,7 @@ from .exceptions import (
     LLMException,
     DocumentLoadException
 )
+from .lexical_index import LexicalIndex, tokenize, fingerprint, reciprocal_rank_fusion
 
 __all__ = [
     "setup_logger",
@@ -17,5 +18,9 @@ __all__ = [
     "ChatSystemException",
     "VectorStoreException", 
     "LLMException",
-    "DocumentLoadException"
+    "DocumentLoadException",
+    "LexicalIndex",
+    "tokenize",
+    "fingerprint",
+    "reciprocal_rank_fusion"
 ]
\ No newline at end of file
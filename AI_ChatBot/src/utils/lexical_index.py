@@ -0,0 +1,180 @@
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+from langchain_core.documents import Document
+
+from config.settings import settings
+from src.utils.exceptions import VectorStoreException
+
+# CJK 統一漢字（擴充 A 區、基本區與相容漢字），以跳脫序列撰寫避免原始碼被正規化
+_CJK_RUN = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+')
+# 非 CJK 部分取 Unicode 字母與數字（含希臘字母、重音字母等）
+_WORD = re.compile(r'[^\W_]+')
+
+INDEX_VERSION = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """斷詞：NFKC 正規化後，CJK 連續字串切為單字與字元 bigram，其餘取 Unicode 字詞（小寫）"""
+    tokens = []
+    normalized = unicodedata.normalize('NFKC', text).lower()
+    for run in _CJK_RUN.findall(normalized):
+        tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    tokens.extend(_WORD.findall(_CJK_RUN.sub(' ', normalized)))
+    return tokens
+
+
+def fingerprint(docs: List[Document]) -> str:
+    """以文檔數量與依序排列的來源及內容計算指紋，用於確認索引與向量資料庫一致"""
+    entries = [[doc.metadata.get("source", ""), doc.page_content] for doc in docs]
+    payload = json.dumps([len(docs), entries], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[Tuple[Document, float]]], k: int, rrf_k: int = None
+) -> List[Tuple[Document, float]]:
+    """以排名倒數融合多組檢索結果（原始分數尺度不同，僅使用排名），分數越高越相關"""
+    rrf_k = settings.RRF_K if rrf_k is None else rrf_k
+    fused_scores: Dict[str, float] = {}
+    docs_by_key: Dict[str, Document] = {}
+    for ranked in ranked_lists:
+        for rank, (doc, _) in enumerate(ranked, start=1):
+            key = doc.metadata.get("source") or doc.page_content
+            docs_by_key.setdefault(key, doc)
+            fused_scores[key] = fused_scores.get(key, 0.0) + 1.0 / (rrf_k + rank)
+
+    ranked_keys = sorted(fused_scores, key=fused_scores.get, reverse=True)[:k]
+    return [(docs_by_key[key], fused_scores[key]) for key in ranked_keys]
+
+
+class LexicalIndex:
+    """記憶體內倒排索引（BM25 評分）"""
+
+    def __init__(self, k1: float = None, b: float = None):
+        self.k1 = settings.BM25_K1 if k1 is None else k1
+        self.b = settings.BM25_B if b is None else b
+        self.documents: List[Document] = []
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.avg_doc_length: float = 0.0
+
+    @classmethod
+    def from_documents(cls, docs: List[Document]) -> "LexicalIndex":
+        """由文檔建立倒排索引"""
+        index = cls()
+        for doc_id, doc in enumerate(docs):
+            term_freqs = Counter(tokenize(doc.page_content))
+            index.documents.append(doc)
+            index.doc_lengths.append(sum(term_freqs.values()))
+            for term, freq in term_freqs.items():
+                index.postings.setdefault(term, {})[doc_id] = freq
+        index._update_stats()
+        return index
+
+    @property
+    def fingerprint(self) -> str:
+        """索引文檔指紋"""
+        return fingerprint(self.documents)
+
+    def _update_stats(self) -> None:
+        """更新平均文檔長度"""
+        self.avg_doc_length = (
+            sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+        )
+
+    def _idf(self, term: str) -> float:
+        """BM25 IDF（加一平滑，避免負值）"""
+        n = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.documents) - n + 0.5) / (n + 0.5))
+
+    def _rank(self, query_terms: List[str]) -> List[Tuple[int, float]]:
+        """計算各文檔的 BM25 分數並依分數排序"""
+        scores: Dict[int, float] = {}
+        if not self.documents:
+            return []
+        for term, query_freq in Counter(query_terms).items():
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = self._idf(term)
+            for doc_id, freq in posting.items():
+                norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length
+                tf = freq * (self.k1 + 1) / (freq + self.k1 * norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_freq * idf * tf
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    def _is_confident(self, query_terms: List[str], ranked: List[Tuple[int, float]]) -> bool:
+        """高信心精確詞查詢：首位文檔須包含所有查詢詞，且分數領先第二名達設定倍數"""
+        if not query_terms or not ranked:
+            return False
+
+        top_id, top_score = ranked[0]
+        if any(top_id not in self.postings.get(term, ()) for term in set(query_terms)):
+            return False
+        if len(ranked) > 1 and top_score < ranked[1][1] * settings.LEXICAL_FAST_PATH_MARGIN:
+            return False
+        return True
+
+    def search_with_confidence(self, query: str, k: int) -> Tuple[List[Tuple[Document, float]], bool]:
+        """執行 BM25 檢索，同時回傳是否為高信心精確詞查詢"""
+        query_terms = tokenize(query)
+        ranked = self._rank(query_terms)
+        results = [(self.documents[doc_id], score) for doc_id, score in ranked[:k]]
+        return results, self._is_confident(query_terms, ranked)
+
+    def search(self, query: str, k: int) -> List[Tuple[Document, float]]:
+        """執行 BM25 檢索，分數越高越相關"""
+        results, _ = self.search_with_confidence(query, k)
+        return results
+
+    def save(self, path: str) -> None:
+        """保存倒排索引為 JSON"""
+        index_path = Path(path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "documents": [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in self.documents
+            ],
+            "doc_lengths": self.doc_lengths,
+            "postings": {
+                term: [[doc_id, freq] for doc_id, freq in posting.items()]
+                for term, posting in self.postings.items()
+            }
+        }
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "LexicalIndex":
+        """從 JSON 載入倒排索引"""
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+
+        if payload.get("version") != INDEX_VERSION:
+            raise VectorStoreException(f"不支援的倒排索引版本: {payload.get('version')}")
+
+        index = cls()
+        index.documents = [
+            Document(page_content=doc["page_content"], metadata=doc["metadata"])
+            for doc in payload["documents"]
+        ]
+        index.doc_lengths = payload["doc_lengths"]
+        index.postings = {
+            term: {doc_id: freq for doc_id, freq in posting}
+            for term, posting in payload["postings"].items()
+        }
+        index._update_stats()
+
+        if payload.get("fingerprint") != index.fingerprint:
+            raise VectorStoreException("倒排索引指紋與內容不符")
+        return index
@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# 測試不需要真實 API Key，僅需通過設定驗證
+os.environ.setdefault('GROQ_API_KEY', 'test-key')
+sys.path.insert(0, str(Path(__file__).parent.parent))
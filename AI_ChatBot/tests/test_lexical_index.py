@@ -0,0 +1,110 @@
+import pytest
+from langchain_core.documents import Document
+
+from src.utils.exceptions import VectorStoreException
+from src.utils.lexical_index import LexicalIndex, fingerprint, reciprocal_rank_fusion, tokenize
+
+
+def _doc(source: str, content: str) -> Document:
+    return Document(page_content=content, metadata={"source": source})
+
+
+@pytest.fixture
+def docs():
+    return [
+        _doc("page_1", "本產品適合糖尿病患者，每份含鈣300毫克"),
+        _doc("page_2", "鈣質補充，鈣含量高，低糖配方"),
+        _doc("page_3", "益生菌有助腸胃健康，含ＤＨＡ"),
+    ]
+
+
+def test_tokenize_mixed_cjk_and_ascii():
+    assert tokenize("糖尿病 Vitamin C 500mg") == [
+        "糖", "尿", "病", "糖尿", "尿病", "vitamin", "c", "500mg"
+    ]
+
+
+def test_tokenize_single_cjk_character():
+    assert tokenize("鈣") == ["鈣"]
+
+
+def test_tokenize_normalizes_full_width():
+    assert tokenize("ＤＨＡ") == tokenize("DHA") == ["dha"]
+
+
+def test_tokenize_ignores_hangul_and_private_use_as_cjk():
+    assert tokenize("비타민") == ["비타민"]
+    assert tokenize("\ue000\ue001鈣") == ["鈣"]
+
+
+def test_tokenize_keeps_non_ascii_letters():
+    assert tokenize("β-胡蘿蔔素 café") == [
+        "胡", "蘿", "蔔", "素", "胡蘿", "蘿蔔", "蔔素", "β", "café"
+    ]
+    assert tokenize("β-胡蘿蔔素") != tokenize("α-胡蘿蔔素")
+
+
+def test_fingerprint_covers_page_content():
+    old = [_doc("Mplan.pdf#page_1", "舊內容 鈣")]
+    new = [_doc("Mplan.pdf#page_1", "新內容 鐵")]
+
+    assert fingerprint(old) != fingerprint(new)
+
+
+def test_search_ranks_by_bm25(docs):
+    index = LexicalIndex.from_documents(docs)
+
+    results = index.search("鈣", 3)
+
+    assert [doc.metadata["source"] for doc, _ in results] == ["page_2", "page_1"]
+    assert results[0][1] > results[1][1]
+
+
+def test_search_matches_full_width_text(docs):
+    index = LexicalIndex.from_documents(docs)
+
+    results = index.search("dha", 3)
+
+    assert [doc.metadata["source"] for doc, _ in results] == ["page_3"]
+
+
+def test_search_with_confidence(docs):
+    index = LexicalIndex.from_documents(docs)
+
+    _, confident = index.search_with_confidence("低糖", 3)
+    assert confident
+
+    _, confident = index.search_with_confidence("低糖 益生菌", 3)
+    assert not confident
+
+
+def test_save_load_round_trip(docs, tmp_path):
+    index = LexicalIndex.from_documents(docs)
+    path = tmp_path / "lexical_index.json"
+
+    index.save(str(path))
+    loaded = LexicalIndex.load(str(path))
+
+    assert loaded.fingerprint == index.fingerprint
+    assert loaded.search("糖尿病", 3) == index.search("糖尿病", 3)
+
+
+def test_load_rejects_unknown_version(docs, tmp_path):
+    path = tmp_path / "lexical_index.json"
+    path.write_text('{"version": 0}', encoding="utf-8")
+
+    with pytest.raises(VectorStoreException):
+        LexicalIndex.load(str(path))
+
+
+def test_reciprocal_rank_fusion_ordering(docs):
+    a, b, c = docs
+    lexical = [(a, 9.0), (b, 5.0)]
+    vector = [(b, 0.1), (c, 0.2), (a, 0.3)]
+
+    results = reciprocal_rank_fusion([lexical, vector], 3, rrf_k=60)
+
+    assert [doc.metadata["source"] for doc, _ in results] == ["page_2", "page_1", "page_3"]
+    assert results[0][1] == pytest.approx(1 / 62 + 1 / 61)
+    assert results[1][1] == pytest.approx(1 / 61 + 1 / 63)
+    assert results[2][1] == pytest.approx(1 / 62)
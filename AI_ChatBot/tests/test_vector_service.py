@@ -0,0 +1,135 @@
+import importlib
+import sys
+import types
+
+import pytest
+from langchain_core.documents import Document
+
+from config.settings import settings
+from src.utils.exceptions import VectorStoreException
+from src.utils.lexical_index import LexicalIndex, fingerprint
+
+DOCS = [
+    Document(page_content="本產品適合糖尿病患者，每份含鈣300毫克", metadata={"source": "page_1"}),
+    Document(page_content="鈣質補充，鈣含量高，低糖配方", metadata={"source": "page_2"}),
+    Document(page_content="益生菌有助腸胃健康", metadata={"source": "page_3"}),
+]
+
+
+class FakeDocstore:
+    def __init__(self, docs):
+        self._dict = {str(i): doc for i, doc in enumerate(docs)}
+
+    def search(self, doc_id):
+        return self._dict[doc_id]
+
+
+class FakeVectorStore:
+    """以固定順序回傳文檔並記錄查詢，用於確認是否呼叫 embedding"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.docstore = FakeDocstore(docs)
+        self.index_to_docstore_id = {i: str(i) for i in range(len(docs))}
+        self.queries = []
+
+    def similarity_search_with_score(self, query, k):
+        self.queries.append(query)
+        return [(doc, float(i)) for i, doc in enumerate(reversed(self.docs[-k:]))]
+
+    def save_local(self, path):
+        pass
+
+
+class FakeFAISS:
+    @classmethod
+    def load_local(cls, path, embeddings, allow_dangerous_deserialization=False):
+        return FakeVectorStore(DOCS)
+
+
+def _fake_modules():
+    """以假模組取代 FAISS、HuggingFace 與 Groq，避免載入真實模型"""
+    modules = {}
+    for name in [
+        "langchain_community",
+        "langchain_community.vectorstores",
+        "langchain_community.document_loaders",
+        "langchain_huggingface",
+        "langchain_groq",
+    ]:
+        modules[name] = types.ModuleType(name)
+    modules["langchain_community.vectorstores"].FAISS = FakeFAISS
+    modules["langchain_community.document_loaders"].PyPDFLoader = object
+    modules["langchain_huggingface"].HuggingFaceEmbeddings = lambda **kwargs: object()
+    modules["langchain_groq"].ChatGroq = lambda **kwargs: object()
+    return modules
+
+
+@pytest.fixture
+def vector_service_module(tmp_path, monkeypatch):
+    for name, module in _fake_modules().items():
+        monkeypatch.setitem(sys.modules, name, module)
+    for name in list(sys.modules):
+        if name.startswith(("src.services", "src.models")):
+            monkeypatch.delitem(sys.modules, name)
+
+    vector_store_path = tmp_path / "vector_store"
+    vector_store_path.mkdir()
+    monkeypatch.setattr(settings, "VECTOR_STORE_PATH", str(vector_store_path))
+    monkeypatch.setattr(settings, "LEXICAL_INDEX_PATH", str(tmp_path / "lexical_index.json"))
+    monkeypatch.setattr(settings, "HYBRID_SEARCH_ENABLED", True)
+    monkeypatch.setattr(settings, "LEXICAL_FAST_PATH_ENABLED", False)
+
+    return importlib.import_module("src.services.vector_service")
+
+
+@pytest.fixture
+def service(vector_service_module):
+    return vector_service_module.VectorService()
+
+
+def test_fast_path_skips_vector_search(service, monkeypatch):
+    monkeypatch.setattr(settings, "LEXICAL_FAST_PATH_ENABLED", True)
+
+    results = service.search_with_score("低糖", k=3)
+
+    assert service.vector_store.queries == []
+    assert [doc.metadata["source"] for doc, _ in results][0] == "page_2"
+    assert results[0][1] == pytest.approx(1 / (settings.RRF_K + 1))
+
+
+def test_fast_path_disabled_uses_vector_search(service):
+    results = service.search_with_score("低糖", k=3)
+
+    assert service.vector_store.queries == ["低糖"]
+    assert results[0][0].metadata["source"] == "page_2"
+    assert service.score_type == "rrf"
+
+
+def test_hybrid_disabled_falls_back_to_l2_search(service, monkeypatch):
+    monkeypatch.setattr(settings, "HYBRID_SEARCH_ENABLED", False)
+
+    results = service.search_with_score("低糖", k=3)
+
+    assert service.vector_store.queries == ["低糖"]
+    assert [score for _, score in results] == [0.0, 1.0, 2.0]
+    assert service.score_type == "l2_distance"
+
+
+def test_fingerprint_mismatch_rebuilds_from_docstore(vector_service_module):
+    stale = LexicalIndex.from_documents(
+        [Document(page_content="舊內容 鐵", metadata={"source": "page_1"})]
+    )
+    stale.save(settings.LEXICAL_INDEX_PATH)
+
+    service = vector_service_module.VectorService()
+
+    assert service.lexical_index.fingerprint == fingerprint(DOCS)
+    assert LexicalIndex.load(settings.LEXICAL_INDEX_PATH).fingerprint == fingerprint(DOCS)
+
+
+def test_missing_lexical_index_error(service):
+    service.lexical_index = None
+
+    with pytest.raises(VectorStoreException, match="倒排索引未初始化"):
+        service.hybrid_search_with_score("低糖")